@@ -1 +0,0 @@
-"""Package for jupythunder2 static assets."""
@@ -1,10 +1,20 @@
 """jupythunder2 package metadata."""
 
-from importlib import metadata
-
-try:
-    __version__ = metadata.version("jupythunder2")
-except metadata.PackageNotFoundError:  # pragma: no cover - during development
-    __version__ = "0.0.0"
+from typing import Any
 
 __all__ = ["__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve the version lazily so importing the package skips importlib.metadata.
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import metadata
+
+    try:
+        version = metadata.version("jupythunder2")
+    except metadata.PackageNotFoundError:  # pragma: no cover - during development
+        version = "0.0.0"
+    globals()["__version__"] = version
+    return version
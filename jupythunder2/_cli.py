@@ -0,0 +1,131 @@
+"""Implementation of the jt2 command, loaded only once the command runs.
+
+``cli.py`` keeps argument parsing; everything that needs Rich, Typer prompts
+or the session stack lives here.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+from .config import JT2Settings, load_config
+
+if TYPE_CHECKING:
+    from .store.codebook import CodebookLogger
+
+_SPLASH_PATH = Path(__file__).parent / "assets" / "splash.txt"
+_SUBTITLE_COLOR = "model=[bold]{model}[/] | auto_execute={state}"
+_SUBTITLE_PLAIN = "model={model} | auto_execute={state}"
+_NUMBER_RE = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=1)
+def _load_splash() -> str:
+    try:
+        return _SPLASH_PATH.read_text(encoding="utf-8")
+    except OSError:
+        return "jupythunder2"
+
+
+def _create_console(use_color: bool) -> Console:
+    return Console(no_color=not use_color, highlight=use_color)
+
+
+def _show_splash(console: Console, settings: JT2Settings) -> None:
+    if not console.is_terminal:
+        # Nobody sees the art when output is piped; skip the panel layout entirely.
+        return
+
+    splash = _load_splash()
+    template = _SUBTITLE_COLOR if settings.use_color else _SUBTITLE_PLAIN
+    subtitle = template.format(model=settings.model, state="ON" if settings.auto_execute else "OFF")
+    console.print(Panel(splash, title="jupythunder2", subtitle=subtitle, highlight=settings.use_color))
+
+
+def _choose_codebook(settings: JT2Settings, console: Console) -> CodebookLogger:
+    from .store.codebook import CodebookLogger, discover_codebooks
+
+    entries = discover_codebooks(settings.codebook_root)
+    if not entries:
+        return _create_new_codebook(settings, console)
+
+    console.print("기존 코드북이 발견되었습니다.")
+    console.print("\n".join(f"[{idx}] {entry.stem} · {entry.summary}" for idx, entry in enumerate(entries, start=1)))
+
+    if typer.confirm("새 코드북을 생성할까요?", default=False):
+        return _create_new_codebook(settings, console)
+
+    interactive = sys.stdin.isatty()
+    while True:
+        if interactive:
+            choice = typer.prompt("불러올 코드북 번호를 입력하세요", default="1").strip()
+        else:
+            # Piped input: read the answer directly, defaulting to the newest codebook.
+            choice = sys.stdin.readline().strip() or "1"
+        if _NUMBER_RE.fullmatch(choice) is None:
+            console.print("번호로 입력해주세요.")
+            continue
+        index = int(choice)
+        if 1 <= index <= len(entries):
+            entry = entries[index - 1]
+            console.print(f"코드북 선택: {entry.stem} · {entry.summary}")
+            return CodebookLogger.open_existing(settings.codebook_root, entry.stem)
+        console.print("목록에 있는 번호를 선택해주세요.")
+
+
+def _create_new_codebook(settings: JT2Settings, console: Console) -> CodebookLogger:
+    from .store.codebook import CodebookLogger
+
+    summary = typer.prompt("새 노트북의 한 줄 요약을 입력하세요", default="새 세션")
+    logger = CodebookLogger.create(settings.codebook_root, summary)
+    console.print(f"새 코드북 생성: {logger.stem} · {logger.summary}")
+    return logger
+
+
+def run(
+    config_path: Optional[Path],
+    auto: Optional[bool],
+    color: Optional[bool],
+    dry_run: bool,
+) -> None:
+    """Load settings, apply CLI overrides and start (or just print) the session."""
+    settings = load_config(config_path, auto_execute=auto, use_color=color)
+
+    console = _create_console(settings.use_color)
+
+    if dry_run:
+        payload = _serialize_settings(settings)
+        console.print(Panel(payload, title="configuration"))
+        return
+
+    # The REPL pulls in prompt_toolkit, jupyter_client and nbformat; only load it for real sessions.
+    from .tui.repl import JT2Repl
+
+    _show_splash(console, settings)
+    codebook = _choose_codebook(settings, console)
+    repl = JT2Repl(settings=settings, codebook=codebook, console=console)
+    try:
+        repl.run()
+    except KeyboardInterrupt:
+        console.print("\n세션을 종료합니다.")
+    finally:
+        repl.shutdown()
+
+
+def _serialize_settings(settings: JT2Settings) -> str:
+    try:  # orjson is an optional speed-up and never escapes non-ASCII text.
+        import orjson
+    except ImportError:
+        return json.dumps(settings.to_dict(), indent=2, ensure_ascii=False)
+    return orjson.dumps(settings.to_dict(), option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+__all__ = ["run"]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import re
 import textwrap
 from dataclasses import dataclass, field
 from typing import List, Optional
@@ -9,8 +10,13 @@ from typing import List, Optional
 from ..config import JT2Settings
 from ..llm.provider import LLMProvider, LLMProviderError
 
+try:  # orjson is an optional speed-up; its decode errors subclass json.JSONDecodeError.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+
+@dataclass(slots=True)
 class CodeCell:
     code: str
     id: Optional[str] = None
@@ -18,7 +24,7 @@ class CodeCell:
     language: str = "python"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     message: str
     plan_items: List[str] = field(default_factory=list)
@@ -71,6 +77,28 @@ PROMPT_TEMPLATE = textwrap.dedent(
 )
 
 
+def _split_prompt_template(template: str) -> tuple[str, str, str]:
+    head, rest = template.split("{history}")
+    middle, tail = rest.split("{message}")
+    head, middle, tail = (part.replace("{{", "{").replace("}}", "}") for part in (head, middle, tail))
+    return head, middle, tail
+
+
+# Static prompt pieces, so building a prompt is plain concatenation instead of str.format.
+_PROMPT_HEAD, _PROMPT_MIDDLE, _PROMPT_TAIL = _split_prompt_template(PROMPT_TEMPLATE)
+
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_CODE_FENCE_RE = re.compile(
+    r"""
+    \A```[^\n]*                 # opening fence line, e.g. ```json
+    (?:\n(?P<body>.*?))??       # lazily matched body
+    (?:\n[ \t]*```[^\n]*)?      # optional closing fence line
+    \s*\Z
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+
 class AgentOrchestrator:
     """Coordinate LLM interactions to produce executable code cells."""
 
@@ -85,9 +113,8 @@ class AgentOrchestrator:
                 raw_text=None,
             )
 
-        limited_history = history[-self.settings.history_limit :]
-        history_text = "\n".join(f"{item['role']}: {item['content']}" for item in limited_history)
-        prompt = PROMPT_TEMPLATE.format(history=history_text, message=message)
+        history_text = self._format_history(history)
+        prompt = _PROMPT_HEAD + history_text + _PROMPT_MIDDLE + message + _PROMPT_TAIL
         try:
             raw = self.llm.complete(prompt)
         except LLMProviderError as exc:
@@ -96,59 +123,56 @@ class AgentOrchestrator:
         return self._parse_response(raw)
 
     # ------------------------------------------------------------------
+    def _format_history(self, history: List[dict[str, str]]) -> str:
+        limited_history = history[-self.settings.history_limit :]
+        return "\n".join(f"{item['role']}: {item['content']}" for item in limited_history)
+
     def _parse_response(self, raw: str) -> AgentResponse:
         payload = raw.strip()
         payload = self._strip_code_fences(payload)
 
         data: Optional[dict] = None
         try:
-            data = json.loads(payload)
+            data = _json_loads(payload)
         except json.JSONDecodeError:
-            brace_start = payload.find("{")
-            brace_end = payload.rfind("}")
-            if brace_start != -1 and brace_end != -1 and brace_end > brace_start:
-                candidate = payload[brace_start : brace_end + 1]
+            match = _JSON_OBJECT_RE.search(payload)
+            if match is not None:
                 try:
-                    data = json.loads(candidate)
+                    data = _json_loads(match.group())
                 except json.JSONDecodeError:
                     data = None
 
         if data is None:
             return AgentResponse(message=raw, raw_text=raw)
 
-        message = str(data.get("message") or raw)
-        plan_value = data.get("plan")
-        plan_items = self._normalise_plan(plan_value)
+        get = data.get
+        message = str(get("message") or raw)
+        plan_items = self._normalise_plan(get("plan"))
 
         code_cells: List[CodeCell] = []
-        for entry in data.get("cells", []):
-            code = entry.get("code")
+        append_cell = code_cells.append
+        for entry in get("cells") or ():
+            entry_get = entry.get
+            code = entry_get("code")
             if not code:
                 continue
-            cell = CodeCell(
-                id=entry.get("id"),
-                description=entry.get("description"),
-                language=entry.get("language", "python"),
-                code=code,
+            append_cell(
+                CodeCell(
+                    code=code,
+                    id=entry_get("id"),
+                    description=entry_get("description"),
+                    language=entry_get("language", "python"),
+                )
             )
-            code_cells.append(cell)
 
         return AgentResponse(message=message, plan_items=plan_items, code_cells=code_cells, raw_text=raw)
 
     def _strip_code_fences(self, payload: str) -> str:
         text = payload.strip()
-        if text.startswith("```"):
-            lines = text.splitlines()
-            if lines:
-                first = lines[0].strip()
-                if first.startswith("```"):
-                    lines = lines[1:]
-            while lines and not lines[-1].strip():
-                lines.pop()
-            if lines and lines[-1].strip().startswith("```"):
-                lines = lines[:-1]
-            text = "\n".join(lines).strip()
-        return text
+        match = _CODE_FENCE_RE.match(text)
+        if match is None:
+            return text
+        return (match.group("body") or "").strip()
 
     def _normalise_plan(self, plan_value: object) -> List[str]:
         if plan_value is None:
@@ -158,12 +182,14 @@ class AgentOrchestrator:
             return [cleaned] if cleaned else []
         if isinstance(plan_value, list):
             items: List[str] = []
+            append_item = items.append
             for item in plan_value:
                 if item is None:
                     continue
-                text_item = str(item).strip()
+                # LLM plans are almost always lists of strings; skip str() for those.
+                text_item = item.strip() if type(item) is str else str(item).strip()
                 if text_item:
-                    items.append(text_item)
+                    append_item(text_item)
             return items
         return [str(plan_value)]
 
@@ -1,59 +1,102 @@
 """Runtime configuration helpers for jupythunder2."""
 from __future__ import annotations
 
-import tomllib
+import os
+import stat
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, ConfigDict, model_validator
 
-DEFAULT_CONFIG_FILES = [
-    Path.cwd() / ".jt2.toml",
-    Path.home() / ".config" / "jt2" / "config.toml",
-]
+def _default_config_files() -> List[Path]:
+    # Resolved per call so a later chdir is honoured and import does no getcwd().
+    return [
+        Path.cwd() / ".jt2.toml",
+        Path.home() / ".config" / "jt2" / "config.toml",
+    ]
 
 
-class JT2Settings(BaseModel):
-    model_config = ConfigDict(json_encoders={Path: str})
-    model: str = Field(default="codegemma:7b", description="기본 LLM 모델 이름")
-    use_color: bool = Field(default=False, description="Rich 컬러/스타일 사용 여부")
-    auto_execute: bool = Field(default=True, description="코드 셀 자동 실행 여부")
-    kernel_name: str = Field(default="python3", description="사용할 Jupyter 커널 이름")
-    codebook_root: Path = Field(default_factory=lambda: Path("codes"), description="노트북/요약 저장 경로")
-    run_root: Path = Field(default_factory=lambda: Path("runs"), description="세션 아티팩트 저장 경로")
-    max_execution_seconds: float = Field(default=60.0, gt=0, description="코드 셀 실행 타임아웃(초)")
-    history_limit: int = Field(default=10, ge=1, description="대화 히스토리 전송 최대 개수")
+@dataclass(slots=True)
+class JT2Settings:
+    model: str = "codegemma:7b"  # 기본 LLM 모델 이름
+    use_color: bool = False  # Rich 컬러/스타일 사용 여부
+    auto_execute: bool = True  # 코드 셀 자동 실행 여부
+    kernel_name: str = "python3"  # 사용할 Jupyter 커널 이름
+    codebook_root: Path = field(default_factory=lambda: Path("codes"))  # 노트북/요약 저장 경로
+    run_root: Path = field(default_factory=lambda: Path("runs"))  # 세션 아티팩트 저장 경로
+    max_execution_seconds: float = 60.0  # 코드 셀 실행 타임아웃(초)
+    history_limit: int = 10  # 대화 히스토리 전송 최대 개수
+    event_batch_size: int = 32  # 세션 이벤트를 한 번에 기록할 최대 개수
+    event_flush_seconds: float = 0.05  # 이벤트 버퍼를 비우는 최대 간격(초)
 
-    @model_validator(mode="after")
-    def _normalize_paths(self) -> "JT2Settings":
-        self.run_root = self.run_root.expanduser()
-        self.codebook_root = self.codebook_root.expanduser()
-        return self
+    def __post_init__(self) -> None:
+        self.model = str(self.model)
+        self.kernel_name = str(self.kernel_name)
+        self.codebook_root = Path(self.codebook_root).expanduser()
+        self.run_root = Path(self.run_root).expanduser()
+        self.max_execution_seconds = float(self.max_execution_seconds)
+        self.history_limit = int(self.history_limit)
+        self.event_batch_size = int(self.event_batch_size)
+        self.event_flush_seconds = float(self.event_flush_seconds)
+        if self.max_execution_seconds <= 0:
+            raise ValueError("max_execution_seconds must be greater than 0")
+        if self.history_limit < 1:
+            raise ValueError("history_limit must be at least 1")
+        if self.event_batch_size < 1:
+            raise ValueError("event_batch_size must be at least 1")
+        if self.event_flush_seconds < 0:
+            raise ValueError("event_flush_seconds must not be negative")
+
+    @classmethod
+    def _from_toml(cls, data: Dict[str, Any]) -> "JT2Settings":
+        known = {item.name for item in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
 
     def to_dict(self) -> Dict[str, Any]:
-        data = self.model_dump()
+        data = asdict(self)
         data["run_root"] = str(self.run_root)
         data["codebook_root"] = str(self.codebook_root)
         return data
 
 
+@lru_cache(maxsize=8)
+def _load_toml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # ``mtime_ns``/``size`` only key the cache so edits invalidate the entry.
+    # The returned dict is shared between calls and must not be mutated.
+    import tomllib
 
-def _load_toml(path: Path) -> Dict[str, Any]:
-    with path.open("rb") as fh:
+    with open(path, "rb") as fh:
         return tomllib.load(fh)
 
 
-def load_config(explicit_path: Optional[Path] = None) -> JT2Settings:
-    """Load configuration from the first available location."""
+def load_config(
+    explicit_path: Optional[Path] = None,
+    *,
+    auto_execute: Optional[bool] = None,
+    use_color: Optional[bool] = None,
+) -> JT2Settings:
+    """Load configuration from the first available location.
+
+    ``auto_execute``/``use_color`` (CLI flags) replace file values; ``None`` means "not set".
+    """
     candidates = []
     if explicit_path is not None:
         candidates.append(explicit_path.expanduser())
-    candidates.extend(DEFAULT_CONFIG_FILES)
+    candidates.extend(_default_config_files())
 
     config_data: Dict[str, Any] = {}
     for candidate in candidates:
-        if candidate.is_file():
-            config_data = _load_toml(candidate)
+        try:
+            st = os.stat(candidate)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            config_data = _load_toml(str(candidate), st.st_mtime_ns, st.st_size)
             break
 
-    return JT2Settings(**config_data)
+    overrides = {"auto_execute": auto_execute, "use_color": use_color}
+    set_overrides = {key: value for key, value in overrides.items() if value is not None}
+    if set_overrides:
+        config_data = {**config_data, **set_overrides}
+    return JT2Settings._from_toml(config_data)
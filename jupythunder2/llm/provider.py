@@ -1,24 +1,30 @@
 """Thin wrapper around the Ollama Python client."""
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 
 class LLMProviderError(RuntimeError):
     """Raised when the LLM backend cannot be reached or responds with an error."""
 
 
+@lru_cache(maxsize=4)
+def _make_client(host: Optional[str]) -> Any:
+    # Shared per host so providers reuse the client's HTTP connection pool.
+    try:
+        from ollama import Client
+    except Exception as exc:  # pragma: no cover - depends on optional package
+        raise LLMProviderError("ollama 클라이언트를 불러올 수 없습니다. `pip install ollama`를 확인하세요.") from exc
+    return Client(host=host) if host else Client()
+
+
 class LLMProvider:
     """Helper that talks to a local Ollama instance."""
 
     def __init__(self, model: str, host: Optional[str] = None) -> None:
-        try:
-            from ollama import Client
-        except Exception as exc:  # pragma: no cover - depends on optional package
-            raise LLMProviderError("ollama 클라이언트를 불러올 수 없습니다. `pip install ollama`를 확인하세요.") from exc
-
         self.model = model
-        self._client = Client(host=host) if host else Client()
+        self._client = _make_client(host or None)
 
     def complete(self, prompt: str, temperature: float = 0.1) -> str:
         try:
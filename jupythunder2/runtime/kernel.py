@@ -1,16 +1,20 @@
 """Wrapper around jupyter_client to execute code cells."""
 from __future__ import annotations
 
-import base64
+import binascii
+import os
 import sys
-import uuid
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from queue import Empty
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterator, List, Optional
 
-from jupyter_client import KernelManager
-from jupyter_client.blocking import BlockingKernelClient
-from jupyter_client.kernelspec import NoSuchKernel
+if TYPE_CHECKING:
+    import zmq
+    from jupyter_client import KernelManager
+    from jupyter_client.blocking import BlockingKernelClient
+    from jupyter_client.session import Session
 
 
 @dataclass
@@ -30,6 +34,9 @@ class ExecutionResult:
     result_text: str = ""
     images: List[Path] = field(default_factory=list)
     error: Optional[ExecutionError] = None
+    # Base64 PNG payloads as received from the kernel, keyed by their path in ``images``.
+    # Consumers may reuse them instead of re-reading the files; not part of ``to_dict``.
+    image_payloads: Dict[Path, str] = field(default_factory=dict, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -41,18 +48,54 @@ class ExecutionResult:
         }
 
 
+@dataclass(slots=True)
+class _Collector:
+    """Per-execute scratch state shared by the IOPub handlers."""
+
+    result: ExecutionResult
+    artifact_dir: Path
+    # Stream chunks; joined into the result's stdout/stderr once execution finishes.
+    stdout: List[str] = field(default_factory=list)
+    stderr: List[str] = field(default_factory=list)
+
+
 class KernelRunner:
     """Manage a Jupyter kernel lifecycle and execute code within it."""
 
     def __init__(self, kernel_name: str = "python3") -> None:
         self.kernel_name = kernel_name
-        self._manager = KernelManager(kernel_name=kernel_name)
+        self._manager = self._new_manager()
         self._client: Optional[BlockingKernelClient] = None
+        self._poller: Optional[zmq.Poller] = None
+        self._warmup: Optional[threading.Thread] = None
+        self._image_seq = 0
 
     # ------------------------------------------------------------------
+    def prewarm(self) -> None:
+        """Start the kernel in the background so the next execute does not wait for it."""
+        if self._client is not None or self._warmup is not None:
+            return
+        self._warmup = threading.Thread(target=self._prewarm, name="jt2-kernel-prewarm", daemon=True)
+        self._warmup.start()
+
+    def _prewarm(self) -> None:
+        try:
+            self.start()
+        except Exception:  # pragma: no cover - the foreground start() retries and reports it
+            pass
+
+    def _join_warmup(self) -> None:
+        warmup = self._warmup
+        if warmup is not None and warmup is not threading.current_thread():
+            warmup.join()
+            self._warmup = None
+
     def start(self) -> None:
+        self._join_warmup()
         if self._client is not None:
             return
+        from jupyter_client.kernelspec import NoSuchKernel
+
         try:
             self._manager.start_kernel()
         except NoSuchKernel:
@@ -65,13 +108,28 @@ class KernelRunner:
                 ) from exc
         client = self._manager.blocking_client()
         client.start_channels()
+        # One poller covers both reply channels for every execute on this client.
+        import zmq
+
+        poller = zmq.Poller()
+        poller.register(client.iopub_channel.socket, zmq.POLLIN)
+        poller.register(client.shell_channel.socket, zmq.POLLIN)
+        self._poller = poller
         self._client = client
 
     def restart(self) -> None:
         self.shutdown()
-        self.start()
+        # shutdown_kernel() destroys the manager's zmq context, so start over with a fresh one.
+        self._manager = self._new_manager()
+        self.prewarm()
+
+    def interrupt(self) -> None:
+        """Interrupt whatever the kernel is currently running."""
+        if self._client is not None:
+            self._manager.interrupt_kernel()
 
     def shutdown(self) -> None:
+        self._join_warmup()
         if self._client is None:
             return
         try:
@@ -79,66 +137,139 @@ class KernelRunner:
         finally:
             self._manager.shutdown_kernel(now=True)
             self._client = None
+            self._poller = None
 
     # ------------------------------------------------------------------
-    def execute(self, code: str, timeout: float, artifact_dir: Path) -> ExecutionResult:
+    def execute(
+        self, code: str, timeout: float, artifact_dir: Path, *, iopub_timeout: float = 1.0
+    ) -> ExecutionResult:
+        """Run ``code`` and collect its outputs.
+
+        ``timeout`` bounds the wait for the execute_reply. Once the reply is in,
+        trailing IOPub output is drained for at most ``iopub_timeout`` seconds so a
+        lost idle status cannot hang the caller for the whole cell budget.
+        """
         self.start()
         assert self._client is not None
+        client = self._client
 
         artifact_dir.mkdir(parents=True, exist_ok=True)
-        msg_id = self._client.execute(code)
+        # Cells run one at a time, so an error (or interrupt) must not abort the next request.
+        msg_id = client.execute(code, stop_on_error=False)
         result = ExecutionResult()
+        out = _Collector(result, artifact_dir)
 
-        while True:
-            msg = self._client.get_iopub_msg(timeout=timeout)
-            if msg.get("parent_header", {}).get("msg_id") != msg_id:
-                continue
-
-            msg_type = msg["header"]["msg_type"]
-            content = msg.get("content", {})
-
-            if msg_type == "stream":
-                text = content.get("text", "")
-                if content.get("name") == "stdout":
-                    result.stdout += text
-                else:
-                    result.stderr += text
-            elif msg_type in {"display_data", "execute_result"}:
-                data = content.get("data", {})
-                text_output = data.get("text/plain")
-                if text_output:
-                    result.result_text = text_output
-                image_png = data.get("image/png")
-                if image_png:
-                    image_path = self._write_image(artifact_dir, image_png)
-                    result.images.append(image_path)
-            elif msg_type == "error":
-                result.error = ExecutionError(
-                    ename=content.get("ename", "Error"),
-                    evalue=content.get("evalue", ""),
-                    traceback=content.get("traceback", []),
-                )
-            elif msg_type == "status" and content.get("execution_state") == "idle":
-                break
-
-        # Drain the shell channel to keep the client in sync.
-        try:
-            self._client.get_shell_msg(timeout=timeout)
-        except Exception:  # pragma: no cover - best effort cleanup
-            pass
+        # Wait on IOPub and shell together so the idle status and the execute_reply
+        # are consumed as they arrive instead of blocking on shell after IOPub.
+        assert self._poller is not None
+        poll = self._poller.poll
+        iopub_socket = client.iopub_channel.socket
+        shell_socket = client.shell_channel.socket
+        session = client.session
+        timeout_ms = int(timeout * 1000)
+        saw_idle = saw_reply = False
+        while not (saw_idle and saw_reply):
+            ready = dict(poll(timeout_ms))
+            if not ready:
+                if saw_reply:
+                    break
+                raise Empty
+            if iopub_socket in ready:
+                for msg in _recv_ready(iopub_socket, session):
+                    saw_idle = self._handle_iopub(msg, msg_id, out) or saw_idle
+            if shell_socket in ready:
+                for reply in _recv_ready(shell_socket, session):
+                    if not saw_reply and reply["parent_header"].get("msg_id") == msg_id:
+                        saw_reply = True
+                        timeout_ms = int(iopub_timeout * 1000)
 
+        result.stdout = "".join(out.stdout)
+        result.stderr = "".join(out.stderr)
         return result
 
+    def _handle_iopub(self, msg: Dict[str, Any], msg_id: str, out: _Collector) -> bool:
+        """Apply one IOPub message to ``out``; return True once the kernel is idle."""
+        # Filter out other requests' messages before touching header/content.
+        # Session.deserialize always fills parent_header/header/content, so index directly.
+        if msg["parent_header"].get("msg_id") != msg_id:
+            return False
+
+        msg_type = msg["header"]["msg_type"]
+        if msg_type == "status":
+            return msg["content"].get("execution_state") == "idle"
+
+        handler = self._IOPUB_HANDLERS.get(msg_type)
+        if handler is not None:
+            handler(self, msg["content"], out)
+        return False
+
+    def _on_stream(self, content: Dict[str, Any], out: _Collector) -> None:
+        text = content.get("text", "")
+        if content.get("name") == "stdout":
+            out.stdout.append(text)
+        else:
+            out.stderr.append(text)
+
+    def _on_display(self, content: Dict[str, Any], out: _Collector) -> None:
+        result = out.result
+        data = content.get("data", {})
+        text_output = data.get("text/plain")
+        if text_output:
+            result.result_text = text_output
+        image_png = data.get("image/png")
+        if image_png:
+            image_path = self._write_image(out.artifact_dir, image_png)
+            result.images.append(image_path)
+            result.image_payloads[image_path] = image_png
+
+    def _on_error(self, content: Dict[str, Any], out: _Collector) -> None:
+        out.result.error = ExecutionError(
+            ename=content.get("ename", "Error"),
+            evalue=content.get("evalue", ""),
+            traceback=content.get("traceback", []),
+        )
+
+    _IOPUB_HANDLERS: ClassVar[Dict[str, Callable[..., None]]] = {
+        "stream": _on_stream,
+        "display_data": _on_display,
+        "execute_result": _on_display,
+        "error": _on_error,
+    }
+
     # ------------------------------------------------------------------
     def _write_image(self, artifact_dir: Path, payload: str) -> Path:
-        image_bytes = base64.b64decode(payload)
-        image_path = artifact_dir / f"image-{uuid.uuid4().hex[:8]}.png"
-        with image_path.open("wb") as fh:
-            fh.write(image_bytes)
+        self._image_seq += 1
+        image_path = artifact_dir / f"image-{self._image_seq:06d}.png"
+        data = memoryview(binascii.a2b_base64(payload))
+        fd = os.open(image_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
         return image_path
 
+    def _new_manager(self) -> KernelManager:
+        # jupyter_client pulls in zmq/tornado/traitlets; only pay for it when a runner exists.
+        from jupyter_client import KernelManager
+
+        return KernelManager(kernel_name=self.kernel_name)
+
     def _default_kernel_cmd(self) -> List[str]:
         return [sys.executable, "-m", "ipykernel_launcher", "-f", "{connection_file}"]
 
 
+def _recv_ready(socket: zmq.Socket, session: Session) -> Iterator[Dict[str, Any]]:
+    """Yield every message already queued on ``socket`` without blocking."""
+    import zmq
+
+    while True:
+        try:
+            frames = socket.recv_multipart(zmq.NOBLOCK)
+        except zmq.Again:
+            return
+        _idents, payload = session.feed_identities(frames)
+        yield session.deserialize(payload)
+
+
 __all__ = ["KernelRunner", "ExecutionResult", "ExecutionError"]
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import base64
+import os
+import shutil
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, TextIO
 
 import nbformat
 from nbformat import NotebookNode
@@ -24,7 +27,14 @@ class CodebookEntry:
 
 
 class CodebookLogger:
-    """Persist executed code and narrative context into *.ipynb/*.md pairs."""
+    """Persist executed code and narrative context into *.ipynb/*.md pairs.
+
+    Notebook rewrites are coalesced: changes made within ``flush_interval``
+    seconds of the last write only mark the notebook dirty, and the next change
+    after the window (or :meth:`flush`/:meth:`close`) writes them all at once.
+    Markdown sections go through one buffered handle that stays open until
+    :meth:`close`.
+    """
 
     def __init__(
         self,
@@ -34,26 +44,34 @@ class CodebookLogger:
         summary: str,
         notebook: NotebookNode,
         markdown_path: Path,
+        flush_interval: float = 0.25,
     ) -> None:
         self.root = root.expanduser()
         self.stem = stem
         self.summary = summary.strip() or "요약 없음"
-        self.notebook_path = notebook_path = self.root / f"{stem}.ipynb"
+        self.notebook_path = self.root / f"{stem}.ipynb"
         self.markdown_path = markdown_path
         self.nb = notebook
+        self.flush_interval = max(0.0, flush_interval)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._md_fh: Optional[TextIO] = None
+        self._stamp_second = -1
+        self._stamp_text = ""
         self._cell_indices: Dict[str, int] = {}
-        self._exec_counter = self._initial_exec_counter()
-        self._synchronise_cell_indices()
+        self._exec_counter = 1
+        self._bootstrap_from_notebook()
 
         # Ensure summary is the first line in markdown.
-        if not self.markdown_path.exists():
+        try:
+            with self.markdown_path.open("r", encoding="utf-8") as fh:
+                first_line = fh.readline()
+        except FileNotFoundError:
+            first_line = ""
+        if not first_line:
             self._initialise_markdown()
-        else:
-            existing = self.markdown_path.read_text(encoding="utf-8").splitlines()
-            if not existing:
-                self._initialise_markdown()
-            elif existing[0].strip() != self.summary:
-                self.markdown_path.write_text("\n".join([self.summary, ""] + existing), encoding="utf-8")
+        elif first_line.strip() != self.summary:
+            self._prepend_summary()
 
         self._flush_notebook()
 
@@ -91,7 +109,7 @@ class CodebookLogger:
 
     # ------------------------------------------------------------------
     def log_user(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._timestamp()
         section = [
             f"## {timestamp} · 사용자",
             "",
@@ -101,7 +119,7 @@ class CodebookLogger:
         self._append_markdown(section)
 
     def log_agent_response(self, response: AgentResponse) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._timestamp()
         section: List[str] = [f"### {timestamp} · 에이전트", "", response.message, ""]
         if response.plan_items:
             section.extend(["#### 계획", ""])
@@ -132,7 +150,7 @@ class CodebookLogger:
         )
         self.nb.cells.append(nb_cell)
         self._cell_indices[cell_id] = len(self.nb.cells) - 1
-        self._flush_notebook()
+        self._schedule_flush()
 
     def record_execution(self, cell_id: str, result: ExecutionResult) -> None:
         idx = self._cell_indices.get(cell_id)
@@ -144,18 +162,37 @@ class CodebookLogger:
         cell["execution_count"] = self._exec_counter
         cell["outputs"] = outputs
         self._exec_counter += 1
-        self._flush_notebook()
-
-        section: List[str] = [f"#### 실행 결과 · {cell_id}", ""]
-        if result.stdout:
-            section.extend(["```text", result.stdout.strip(), "```", ""])
-        if result.stderr:
-            section.extend(["```text", result.stderr.strip(), "```", ""])
-        if result.result_text:
-            section.extend([f"> {result.result_text.strip()}", ""])
+        self._schedule_flush()
+
+        body: List[str] = []
+        stdout = result.stdout.strip()
+        if stdout:
+            body.extend(["```text", stdout, "```", ""])
+        stderr = result.stderr.strip()
+        if stderr:
+            body.extend(["```text", stderr, "```", ""])
+        result_text = result.result_text.strip()
+        if result_text:
+            body.extend([f"> {result_text}", ""])
         if result.error is not None:
-            section.extend([f"⚠️ 오류: {result.error.ename}: {result.error.evalue}", ""])
-        self._append_markdown(section)
+            body.extend([f"⚠️ 오류: {result.error.ename}: {result.error.evalue}", ""])
+        # Silent cells would only add a bare heading; the notebook already records the run.
+        if body:
+            self._append_markdown([f"#### 실행 결과 · {cell_id}", "", *body])
+
+    def flush(self) -> None:
+        """Write pending notebook and markdown changes to disk."""
+        if self._dirty:
+            self._flush_notebook()
+        if self._md_fh is not None:
+            self._md_fh.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._md_fh is not None:
+            os.fsync(self._md_fh.fileno())
+            self._md_fh.close()
+            self._md_fh = None
 
     # ------------------------------------------------------------------
     def _initialise_markdown(self) -> None:
@@ -168,23 +205,58 @@ class CodebookLogger:
         ]
         self.markdown_path.write_text("\n".join(lines), encoding="utf-8")
 
+    def _prepend_summary(self) -> None:
+        # Stream the existing log behind the summary instead of loading it into memory.
+        tmp_path = self.markdown_path.with_name(self.markdown_path.name + ".tmp")
+        with self.markdown_path.open("r", encoding="utf-8") as src, tmp_path.open("w", encoding="utf-8") as dst:
+            dst.write(self.summary + "\n\n")
+            shutil.copyfileobj(src, dst, 1 << 20)
+        os.replace(tmp_path, self.markdown_path)
+
     def _append_markdown(self, lines: List[str]) -> None:
-        with self.markdown_path.open("a", encoding="utf-8") as fh:
-            fh.write("\n".join(lines) + "\n")
+        fh = self._md_fh
+        if fh is None:
+            fh = self._md_fh = self.markdown_path.open("a", encoding="utf-8")
+        fh.write("\n".join(lines) + "\n")
+        # Keep the handle open but hand each section to the OS so a killed process loses nothing.
+        fh.flush()
+
+    def _timestamp(self) -> str:
+        # A turn logs several sections within the same second; format it once.
+        now = int(time.time())
+        if now != self._stamp_second:
+            self._stamp_second = now
+            self._stamp_text = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._stamp_text
+
+    def _schedule_flush(self) -> None:
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush_notebook()
 
     def _flush_notebook(self) -> None:
-        nbformat.write(self.nb, self.notebook_path)
-
-    def _initial_exec_counter(self) -> int:
-        counters = [cell.get("execution_count") for cell in self.nb.cells if cell.get("execution_count")]
-        return (max(counters) + 1) if counters else 1
-
-    def _synchronise_cell_indices(self) -> None:
-        self._cell_indices.clear()
+        # Write a sibling temp file and rename it over the notebook so a crash never leaves it truncated.
+        tmp_path = self.notebook_path.with_name(self.notebook_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            nbformat.write(self.nb, fh)
+        os.replace(tmp_path, self.notebook_path)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def _bootstrap_from_notebook(self) -> None:
+        """Index tagged cells and resume the execution counter in one pass."""
+        indices = self._cell_indices
+        indices.clear()
+        max_exec = 0
         for idx, cell in enumerate(self.nb.cells):
-            cell_id = cell.metadata.get("cell_id") if hasattr(cell, "metadata") else None
+            count = cell.get("execution_count") or 0
+            if count > max_exec:
+                max_exec = count
+            metadata = cell.get("metadata")
+            cell_id = metadata.get("cell_id") if metadata else None
             if cell_id:
-                self._cell_indices[cell_id] = idx
+                indices[cell_id] = idx
+        self._exec_counter = max_exec + 1
 
     def _build_outputs(self, result: ExecutionResult) -> Iterable[NotebookNode]:
         if result.stdout:
@@ -199,15 +271,14 @@ class CodebookLogger:
                 execution_count=self._exec_counter,
             )
         for image_path in result.images:
-            try:
-                payload = image_path.read_bytes()
-            except OSError:
-                continue
-            yield nbf.new_output(
-                "display_data",
-                data={"image/png": base64.b64encode(payload).decode("ascii")},
-                metadata={},
-            )
+            # Reuse the kernel's base64 payload instead of re-reading and re-encoding the PNG.
+            encoded = result.image_payloads.get(image_path)
+            if encoded is None:
+                try:
+                    encoded = base64.b64encode(image_path.read_bytes()).decode("ascii")
+                except OSError:
+                    continue
+            yield nbf.new_output("display_data", data={"image/png": encoded}, metadata={})
         if result.error is not None:
             yield self._error_output(result.error)
 
@@ -229,21 +300,34 @@ def discover_codebooks(root: Path) -> List[CodebookEntry]:
     if not root.is_dir():
         return []
 
+    # One directory scan gives both the markdown stems and the notebooks that pair with them.
+    markdown_stems: List[str] = []
+    notebook_stems: Set[str] = set()
+    with os.scandir(root) as it:
+        for dir_entry in it:
+            stem, ext = os.path.splitext(dir_entry.name)
+            if ext == ".md":
+                markdown_stems.append(stem)
+            elif ext == ".ipynb":
+                notebook_stems.add(stem)
+
     entries: List[CodebookEntry] = []
-    for md_path in sorted(root.glob("*.md"), reverse=True):
-        stem = md_path.stem
-        notebook_path = root / f"{stem}.ipynb"
-        if not notebook_path.exists():
+    for stem in sorted(markdown_stems, reverse=True):
+        if stem not in notebook_stems:
             continue
+        md_path = root / f"{stem}.md"
         summary = _read_summary(md_path)
-        entries.append(CodebookEntry(stem=stem, summary=summary, notebook_path=notebook_path, markdown_path=md_path))
+        entries.append(
+            CodebookEntry(stem=stem, summary=summary, notebook_path=root / f"{stem}.ipynb", markdown_path=md_path)
+        )
     return entries
 
 
 def _read_summary(markdown_path: Path) -> str:
     try:
-        first_line = markdown_path.read_text(encoding="utf-8").splitlines()[0]
-    except (OSError, IndexError):
+        with markdown_path.open("r", encoding="utf-8") as fh:
+            first_line = fh.readline()
+    except OSError:
         return "요약 없음"
     return first_line.strip() or "요약 없음"
 
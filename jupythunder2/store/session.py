@@ -2,52 +2,105 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import os
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+try:  # orjson is an optional speed-up; both paths yield compact UTF-8 bytes.
+    from orjson import dumps as _encode_record
+except ImportError:
+    _encode_text = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def _encode_record(record: Dict[str, Any]) -> bytes:
+        return _encode_text(record).encode("utf-8")
 
 
 class SessionStore:
-    """Persist session artefacts and structured logs."""
+    """Persist session artefacts and structured logs.
+
+    Events are appended through a single ``O_APPEND`` descriptor kept open for
+    the whole session. ``batch_size`` and ``flush_interval`` (seconds) control how many
+    encoded records are buffered in memory before they hit the file; the
+    defaults flush every event so the log stays readable while a session runs.
+    """
 
-    def __init__(self, run_root: Path) -> None:
+    def __init__(self, run_root: Path, *, batch_size: int = 1, flush_interval: float = 0.0) -> None:
         self.run_root = run_root
         self.run_root.mkdir(parents=True, exist_ok=True)
+        self._run_root_str = str(run_root)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
         self._session_dir: Optional[Path] = None
         self._events_file: Optional[Path] = None
+        self._fd: Optional[int] = None
+        self._pending: List[bytes] = []
+        self._last_flush = time.monotonic()
+        self._stamp_second = -1
+        self._stamp_text = ""
 
     def start_session(self) -> Path:
         if self._session_dir is not None:
             return self._session_dir
 
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        session_dir = self.run_root / timestamp
+        base = os.path.join(self._run_root_str, time.strftime("%Y%m%d-%H%M%S"))
+        candidate = base
         suffix = 1
-        while session_dir.exists():
-            suffix += 1
-            session_dir = self.run_root / f"{timestamp}-{suffix}"
-        session_dir.mkdir(parents=True, exist_ok=False)
+        while True:
+            try:
+                os.makedirs(candidate, exist_ok=False)
+                break
+            except FileExistsError:
+                suffix += 1
+                candidate = f"{base}-{suffix}"
 
-        events_file = session_dir / "events.jsonl"
-        events_file.touch()
+        events_file = os.path.join(candidate, "events.jsonl")
+        self._fd = os.open(events_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
 
-        self._session_dir = session_dir
-        self._events_file = events_file
+        self._session_dir = session_dir = Path(candidate)
+        self._events_file = Path(events_file)
+        self._last_flush = time.monotonic()
         return session_dir
 
     def append_event(self, event_type: str, payload: Dict[str, Any]) -> None:
-        if self._events_file is None:
+        if self._fd is None:
             return
         record = {
-            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "timestamp": self._timestamp(),
             "type": event_type,
             "payload": payload,
         }
-        with self._events_file.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._pending.append(_encode_record(record) + b"\n")
+        if len(self._pending) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered events to disk."""
+        if self._fd is None:
+            return
+        if self._pending:
+            data = memoryview(b"".join(self._pending))
+            self._pending.clear()
+            while data:
+                written = os.write(self._fd, data)
+                data = data[written:]
+        self._last_flush = time.monotonic()
+
+    def _timestamp(self) -> str:
+        # Events arrive in bursts; format each wall-clock second only once.
+        now = int(time.time())
+        if now != self._stamp_second:
+            self._stamp_second = now
+            self._stamp_text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now))
+        return self._stamp_text
 
     def finish_session(self) -> None:
-        # Placeholder for future resource management
+        if self._fd is not None:
+            try:
+                self.flush()
+            finally:
+                os.close(self._fd)
+                self._fd = None
         self._session_dir = None
         self._events_file = None
 
@@ -1,21 +1,27 @@
 """Interactive REPL loop for jupythunder2."""
 from __future__ import annotations
 
+import itertools
 import re
+import secrets
 import shlex
 import subprocess
-import uuid
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-from prompt_toolkit.history import InMemoryHistory
+from prompt_toolkit.history import FileHistory, ThreadedHistory
 from prompt_toolkit.patch_stdout import patch_stdout
-from rich.console import Console
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+from rich.console import Console, Group
 from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.syntax import Syntax, SyntaxTheme
+from rich.text import Text
 
 from ..agent.orchestrator import AgentOrchestrator, AgentResponse, CodeCell
 from ..config import JT2Settings
@@ -26,6 +32,47 @@ from ..store.session import SessionStore
 from .animation import AsciiAnimator
 
 
+_MISSING_MODULE_RE = re.compile(r"named ['\"]([^'\"]+)['\"]")
+
+
+@lru_cache(maxsize=16)
+def _lexer_for(language: str) -> Lexer:
+    try:
+        return get_lexer_by_name(language)
+    except ClassNotFound:
+        # Same as Rich's own handling of an unknown lexer name: no highlighting.
+        return get_lexer_by_name("text")
+
+
+@lru_cache(maxsize=1)
+def _syntax_theme() -> SyntaxTheme:
+    return Syntax.get_theme("monokai")
+
+
+def _code_syntax(code: str, language: str = "python") -> Syntax:
+    """Build a code renderable, reusing the lexer and theme across panels."""
+    return Syntax(code, _lexer_for(language), theme=_syntax_theme(), line_numbers=False, word_wrap=True)
+
+
+# Built once as plain Text so /help skips markup parsing on every print.
+_HELP_PANEL = Panel(
+    Text(
+        "\n".join(
+            [
+                "/help : 명령어 목록 표시",
+                "/quit : 세션 종료",
+                "/auto on|off : 코드 자동 실행 토글",
+                "/reset : Jupyter 커널 재시작",
+                "/cells : 대기 중인 코드 셀 목록",
+                "/exec <cell-id|all> : 코드 셀 실행",
+                "/code <python> : 즉시 실행할 파이썬 코드 큐에 추가",
+            ]
+        )
+    ),
+    title="명령어",
+)
+
+
 @dataclass
 class PendingCell:
     cell: CodeCell
@@ -38,8 +85,14 @@ class JT2Repl:
     def __init__(self, settings: JT2Settings, codebook: CodebookLogger, console: Optional[Console] = None) -> None:
         self.settings = settings
         self.console = console or Console(no_color=not settings.use_color, highlight=settings.use_color)
-        self.session = PromptSession(history=InMemoryHistory(), auto_suggest=AutoSuggestFromHistory())
-        self.store = SessionStore(settings.run_root)
+        self.store = SessionStore(
+            settings.run_root,
+            batch_size=settings.event_batch_size,
+            flush_interval=settings.event_flush_seconds,
+        )
+        # Input history persists across sessions; ThreadedHistory loads it off the prompt thread.
+        history = ThreadedHistory(FileHistory(str(settings.run_root / "repl_history")))
+        self.session = PromptSession(history=history, auto_suggest=AutoSuggestFromHistory())
         self.session_dir = self.store.start_session()
         self.kernel = KernelRunner(kernel_name=settings.kernel_name)
         self.debugger = Debugger()
@@ -51,6 +104,8 @@ class JT2Repl:
         self.codebook = codebook
         self._animation = AsciiAnimator(self.console)
         self._install_prompts: Set[str] = set()
+        self._id_prefix = secrets.token_hex(3)
+        self._id_counter = itertools.count(1)
 
     # ------------------------------------------------------------------
     # lifecycle
@@ -59,8 +114,12 @@ class JT2Repl:
         """Start the interactive prompt loop."""
         self.console.print(f"코드북: {self.codebook.stem} · {self.codebook.summary}")
         self.console.print("인터랙티브 세션을 시작합니다. `/help` 로 명령어를 확인하세요.")
+        self.kernel.prewarm()
         with patch_stdout():
             while self.running:
+                # Batched events and coalesced codebook writes must not outlive the turn that produced them.
+                self.store.flush()
+                self.codebook.flush()
                 try:
                     user_input = self.session.prompt("jt2> ")
                 except EOFError:
@@ -81,6 +140,7 @@ class JT2Repl:
     def shutdown(self) -> None:
         """Release resources gracefully."""
         self.kernel.shutdown()
+        self.codebook.close()
         self.store.finish_session()
 
     # ------------------------------------------------------------------
@@ -136,11 +196,7 @@ class JT2Repl:
             self.console.print(Panel(Markdown(plan_text), title="계획"))
 
     def _render_pending_cell(self, cell_id: str, tracked: PendingCell) -> None:
-        language = tracked.cell.language or "python"
-        try:
-            syntax = Syntax(tracked.cell.code, language, theme="monokai", line_numbers=False, word_wrap=True)
-        except Exception:
-            syntax = Syntax(tracked.cell.code, "python", theme="monokai", line_numbers=False, word_wrap=True)
+        syntax = _code_syntax(tracked.cell.code, tracked.cell.language or "python")
         subtitle = tracked.cell.description or None
         self.console.print(Panel(syntax, title=f"대기 {cell_id}", subtitle=subtitle))
 
@@ -180,22 +236,7 @@ class JT2Repl:
         return True
 
     def _command_help(self) -> None:
-        self.console.print(
-            Panel(
-                "\n".join(
-                    [
-                        "/help : 명령어 목록 표시",
-                        "/quit : 세션 종료",
-                        "/auto on|off : 코드 자동 실행 토글",
-                        "/reset : Jupyter 커널 재시작",
-                        "/cells : 대기 중인 코드 셀 목록",
-                        "/exec <cell-id|all> : 코드 셀 실행",
-                        "/code <python> : 즉시 실행할 파이썬 코드 큐에 추가",
-                    ]
-                ),
-                title="명령어",
-            )
-        )
+        self.console.print(_HELP_PANEL)
 
     def _command_auto(self, value: str) -> None:
         normalized = value.lower()
@@ -222,11 +263,8 @@ class JT2Repl:
 
     def _command_exec(self, args: List[str]) -> None:
         target = args[0]
-        if target == "all":
-            ids = list(self.pending_cells.keys())
-        else:
-            ids = [target]
-        self._execute_cells(ids)
+        # Snapshot once: _execute_cells pops from pending_cells while it runs.
+        self._execute_cells(list(self.pending_cells) if target == "all" else (target,))
 
     def _command_code(self, parts: List[str]) -> None:
         if not parts:
@@ -237,27 +275,28 @@ class JT2Repl:
         cell = CodeCell(id=cell_id, description="manual input", language="python", code=code)
         tracked = PendingCell(cell=cell, origin="user")
         self.pending_cells[cell_id] = tracked
-        try:
-            syntax = Syntax(code, "python", theme="monokai", line_numbers=False, word_wrap=True)
-        except Exception:
-            syntax = code
-        self.console.print(Panel(syntax, title=f"대기 {cell_id}", subtitle="manual input"))
+        self.console.print(Panel(_code_syntax(code), title=f"대기 {cell_id}", subtitle="manual input"))
         self.codebook.register_code_cell(cell_id, code, description="manual input", origin="user")
         if self.auto_execute:
-            self._execute_cells([cell_id])
+            self._execute_cells((cell_id,))
 
     # ------------------------------------------------------------------
     # execution helpers
     # ------------------------------------------------------------------
-    def _execute_cells(self, cell_ids: List[str]) -> None:
+    def _execute_cells(self, cell_ids: Iterable[str]) -> None:
         for cell_id in cell_ids:
             tracked = self.pending_cells.pop(cell_id, None)
             if not tracked:
                 self.console.print(f"셀을 찾을 수 없습니다: {cell_id}")
                 continue
-            self._execute_cell(cell_id, tracked)
-
-    def _execute_cell(self, cell_id: str, tracked: PendingCell) -> None:
+            if not self._execute_cell(cell_id, tracked):
+                # Ctrl-C aborts the whole batch; whatever was not started stays pending.
+                if self.pending_cells:
+                    self.console.print("남은 셀은 대기 중입니다. `/cells`로 확인하세요.")
+                return
+
+    def _execute_cell(self, cell_id: str, tracked: PendingCell) -> bool:
+        """Run one cell; return False if the user interrupted it."""
         self.console.print(f"실행 중... {cell_id}")
         self._animation.start("커널에서 코드를 실행 중...")
         try:
@@ -266,6 +305,12 @@ class JT2Repl:
                 timeout=self.settings.max_execution_seconds,
                 artifact_dir=self.session_dir,
             )
+        except KeyboardInterrupt:
+            # Ctrl-C stops the cell, not the session; late replies are dropped by parent id.
+            self.kernel.interrupt()
+            self.console.print(f"실행을 중단했습니다: {cell_id}")
+            self.store.append_event("system", {"action": "interrupt", "cell_id": cell_id})
+            return False
         finally:
             self._animation.stop()
         self.store.append_event(
@@ -279,8 +324,14 @@ class JT2Repl:
         )
         self._render_execution_result(cell_id, result)
         self.codebook.record_execution(cell_id, result)
+        return True
 
     def _render_execution_result(self, cell_id: str, result: ExecutionResult) -> None:
+        if not (result.stdout or result.stderr or result.result_text or result.images or result.error):
+            # Plain Text: agent-supplied cell ids must not be parsed as markup.
+            self.console.print(Text(f"{cell_id} · (no output)", style="dim"))
+            return
+
         blocks = []
         if result.stdout:
             blocks.append(Panel(result.stdout, title=f"{cell_id} · stdout"))
@@ -295,17 +346,9 @@ class JT2Repl:
             panel_text = summary.explanation
             if summary.suggestion:
                 panel_text += f"\n\n제안: {summary.suggestion}"
-            try:
-                body = Markdown(panel_text)
-            except Exception:
-                body = panel_text
-            blocks.append(Panel(body, title=f"{cell_id} · 디버그"))
-
-        if not blocks:
-            blocks.append(Panel("(no output)", title=f"{cell_id} · 결과"))
+            blocks.append(Panel(Markdown(panel_text), title=f"{cell_id} · 디버그"))
 
-        for block in blocks:
-            self.console.print(block)
+        self.console.print(Group(*blocks))
 
         if result.error is not None:
             self._maybe_offer_install(result.error)
@@ -314,7 +357,8 @@ class JT2Repl:
     # utils
     # ------------------------------------------------------------------
     def _make_cell_id(self, prefix: str) -> str:
-        return f"{prefix}-{uuid.uuid4().hex[:6]}"
+        # Reopened codebooks keep earlier ids, so the per-session random part keeps new ones distinct.
+        return f"{prefix}-{self._id_prefix}{next(self._id_counter):03x}"
 
     def _maybe_offer_install(self, error: ExecutionError) -> None:
         if error.ename not in {"ModuleNotFoundError", "ImportError"}:
@@ -337,7 +381,7 @@ class JT2Repl:
             self.console.print("`uv` 명령을 찾을 수 없습니다. 수동으로 패키지를 설치해주세요.")
 
     def _extract_missing_module(self, message: str) -> Optional[str]:
-        match = re.search(r"named ['\"]([^'\"]+)['\"]", message)
+        match = _MISSING_MODULE_RE.search(message)
         if match:
             return match.group(1)
         return None
@@ -0,0 +1,57 @@
+"""Fail when importing a jupythunder2 module gets slower than a budget.
+
+Usage: python scripts/check_import_time.py [module] [--budget-us N]
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter and
+compares the cumulative time reported for that module against the budget.
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from typing import Dict
+
+DEFAULT_MODULE = "jupythunder2.cli"
+DEFAULT_BUDGET_US = 50_000
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Map module name to cumulative microseconds from ``-X importtime`` output."""
+    cumulative: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self_us, cumulative_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if cumulative_us.isdigit():  # skips the header line
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+def measure(module: str) -> int:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = parse_importtime(proc.stderr)
+    if module not in timings:
+        raise RuntimeError(f"no import timing reported for {module!r}")
+    return timings[module]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default=DEFAULT_MODULE)
+    parser.add_argument("--budget-us", type=int, default=DEFAULT_BUDGET_US)
+    args = parser.parse_args()
+
+    elapsed = measure(args.module)
+    status = "ok" if elapsed <= args.budget_us else "FAIL"
+    print(f"{status}: import {args.module} took {elapsed} us (budget {args.budget_us} us)")
+    return 0 if elapsed <= args.budget_us else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -41,3 +41,38 @@ def test_parse_response_handles_code_fences() -> None:
     assert response.message == "fenced"
     assert response.plan_items == ["single step"]
     assert response.code_cells == []
+
+
+def test_format_history_keeps_latest_window() -> None:
+    settings = JT2Settings(history_limit=2)
+    orchestrator = AgentOrchestrator(settings=settings, llm=None)
+
+    history = [{"role": "user", "content": "first"}]
+    assert orchestrator._format_history(history) == "user: first"
+
+    history.append({"role": "assistant", "content": "second"})
+    history.append({"role": "user", "content": "third"})
+    assert orchestrator._format_history(history) == "assistant: second\nuser: third"
+
+    history[-1]["content"] = "edited"
+    assert orchestrator._format_history(history) == "assistant: second\nuser: edited"
+
+    fresh = [{"role": "user", "content": "other"}]
+    assert orchestrator._format_history(fresh) == "user: other"
+
+
+def test_strip_code_fences_variants() -> None:
+    orchestrator = AgentOrchestrator(settings=JT2Settings(), llm=None)
+
+    assert orchestrator._strip_code_fences('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert orchestrator._strip_code_fences('```\n{"a": 1}') == '{"a": 1}'
+    assert orchestrator._strip_code_fences("```json") == ""
+    assert orchestrator._strip_code_fences('  {"a": 1}  ') == '{"a": 1}'
+
+
+def test_prompt_pieces_match_template() -> None:
+    from jupythunder2.agent import orchestrator as module
+
+    prompt = module._PROMPT_HEAD + "user: hi" + module._PROMPT_MIDDLE + "say {hi}" + module._PROMPT_TAIL
+    assert prompt == module.PROMPT_TEMPLATE.format(history="user: hi", message="say {hi}")
+
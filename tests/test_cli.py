@@ -1,11 +1,51 @@
+import pytest
 from typer.testing import CliRunner
 
-from jupythunder2.cli import app
+from jupythunder2.cli import app, entrypoint
 
 
-def test_cli_dry_run() -> None:
-    runner = CliRunner()
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+def test_cli_dry_run(runner: CliRunner) -> None:
     result = runner.invoke(app, ["--dry-run"])
 
     assert result.exit_code == 0
     assert "configuration" in result.stdout
+
+
+def test_cli_version(monkeypatch, capsys) -> None:
+    # `jt2 --version` is answered by entrypoint() before Typer is involved.
+    monkeypatch.setattr("sys.argv", ["jt2", "--version"])
+
+    entrypoint()
+
+    assert capsys.readouterr().out.startswith("jupythunder2 ")
+
+
+def test_cli_version_flag_with_dry_run(runner: CliRunner) -> None:
+    # The Typer app still honours --version when it is combined with other options.
+    result = runner.invoke(app, ["--version", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert result.stdout.startswith("jupythunder2 ")
+
+
+def test_choose_codebook_reads_piped_selection(tmp_path, monkeypatch) -> None:
+    import io
+
+    from rich.console import Console
+
+    from jupythunder2._cli import _choose_codebook
+    from jupythunder2.config import JT2Settings
+    from jupythunder2.store.codebook import CodebookLogger
+
+    existing = CodebookLogger.create(tmp_path, "기존 세션")
+    settings = JT2Settings(codebook_root=tmp_path)
+    monkeypatch.setattr("sys.stdin", io.StringIO("n\nabc\n1\n"))
+
+    logger = _choose_codebook(settings, Console(file=io.StringIO()))
+
+    assert logger.stem == existing.stem
@@ -17,6 +17,7 @@ def test_codebook_logger_writes_notebook_and_markdown(tmp_path: Path) -> None:
 
     result = ExecutionResult(stdout="hello\n")
     logger.record_execution("cell-1", result)
+    logger.close()
 
     assert logger.notebook_path.exists()
     assert logger.markdown_path.exists()
@@ -31,3 +32,55 @@ def test_codebook_logger_writes_notebook_and_markdown(tmp_path: Path) -> None:
 
     entries = discover_codebooks(tmp_path)
     assert entries and entries[0].stem == logger.stem
+
+
+def test_codebook_logger_coalesces_notebook_writes(tmp_path: Path) -> None:
+    logger = CodebookLogger.create(tmp_path, "배치 세션")
+    logger.flush_interval = 60.0
+
+    logger.register_code_cell("cell-1", "x = 1")
+    logger.register_code_cell("cell-2", "y = 2")
+    assert "x = 1" not in logger.notebook_path.read_text(encoding="utf-8")
+
+    logger.flush()
+    notebook_text = logger.notebook_path.read_text(encoding="utf-8")
+    assert "x = 1" in notebook_text and "y = 2" in notebook_text
+
+
+def test_open_existing_resumes_cell_indices_and_counter(tmp_path: Path) -> None:
+    logger = CodebookLogger.create(tmp_path, "재개 세션")
+    logger.register_code_cell("cell-1", "x = 1")
+    logger.record_execution("cell-1", ExecutionResult())
+    logger.close()
+
+    reopened = CodebookLogger.open_existing(tmp_path, logger.stem)
+    assert reopened._cell_indices == {"cell-1": 0}
+    assert reopened._exec_counter == 2
+    reopened.close()
+
+
+def test_discover_codebooks_skips_markdown_without_notebook(tmp_path: Path) -> None:
+    logger = CodebookLogger.create(tmp_path, "짝이 있는 세션")
+    logger.close()
+    (tmp_path / "orphan.md").write_text("짝 없는 세션\n", encoding="utf-8")
+
+    entries = discover_codebooks(tmp_path)
+
+    assert [entry.stem for entry in entries] == [logger.stem]
+    assert entries[0].summary == "짝이 있는 세션"
+
+def test_record_execution_skips_empty_markdown_section(tmp_path: Path) -> None:
+    logger = CodebookLogger.create(tmp_path, "조용한 셀")
+    logger.register_code_cell("cell-1", "x = 1")
+    logger.record_execution("cell-1", ExecutionResult(stdout="\n"))
+    logger.close()
+
+    assert "실행 결과" not in logger.markdown_path.read_text(encoding="utf-8")
+
+
+def test_markdown_sections_reach_disk_before_close(tmp_path: Path) -> None:
+    logger = CodebookLogger.create(tmp_path, "중단 세션")
+    logger.log_user("저장되어야 할 질문")
+
+    assert "저장되어야 할 질문" in logger.markdown_path.read_text(encoding="utf-8")
+    logger.close()
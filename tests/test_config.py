@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from jupythunder2.config import JT2Settings, load_config
+
+
+def test_load_config_reloads_after_file_change(tmp_path: Path) -> None:
+    config_path = tmp_path / "jt2.toml"
+    config_path.write_text('model = "first"\n', encoding="utf-8")
+    assert load_config(config_path).model == "first"
+    assert load_config(config_path).model == "first"
+
+    config_path.write_text('model = "second"\n', encoding="utf-8")
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_config(config_path).model == "second"
+
+
+def test_load_config_coerces_values_and_ignores_unknown_keys(tmp_path: Path) -> None:
+    config_path = tmp_path / "jt2.toml"
+    config_path.write_text(
+        'run_root = "~/jt2-runs"\nmax_execution_seconds = 5\nunknown = 1\n',
+        encoding="utf-8",
+    )
+
+    settings = load_config(config_path)
+
+    assert settings.run_root == Path("~/jt2-runs").expanduser()
+    assert settings.max_execution_seconds == 5.0
+
+
+def test_settings_reject_invalid_limits() -> None:
+    with pytest.raises(ValueError):
+        JT2Settings(max_execution_seconds=0)
+    with pytest.raises(ValueError):
+        JT2Settings(history_limit=0)
+    with pytest.raises(ValueError):
+        JT2Settings(event_batch_size=0)
+    with pytest.raises(ValueError):
+        JT2Settings(event_flush_seconds=-1)
+
+
+def test_load_config_applies_overrides(tmp_path: Path) -> None:
+    config_path = tmp_path / "jt2.toml"
+    config_path.write_text("auto_execute = false\nuse_color = true\n", encoding="utf-8")
+
+    settings = load_config(config_path, auto_execute=True, use_color=None)
+
+    assert settings.auto_execute is True
+    assert settings.use_color is True
+
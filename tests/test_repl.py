@@ -0,0 +1,68 @@
+import io
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+from rich.console import Console
+
+from jupythunder2.agent.orchestrator import CodeCell
+from jupythunder2.runtime.kernel import ExecutionResult
+from jupythunder2.tui.repl import JT2Repl, PendingCell, _lexer_for
+
+
+class _InterruptingKernel:
+    def __init__(self) -> None:
+        self.executed: List[str] = []
+        self.interrupts = 0
+
+    def execute(self, code: str, timeout: float, artifact_dir: Path) -> ExecutionResult:
+        self.executed.append(code)
+        raise KeyboardInterrupt
+
+    def interrupt(self) -> None:
+        self.interrupts += 1
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls: List[tuple] = []
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: self.calls.append((name, args))
+
+
+def test_interrupt_stops_remaining_cells(tmp_path: Path) -> None:
+    repl = JT2Repl.__new__(JT2Repl)
+    repl.console = Console(file=io.StringIO())
+    repl.kernel = _InterruptingKernel()
+    repl.store = _Recorder()
+    repl.codebook = _Recorder()
+    repl._animation = _Recorder()
+    repl.settings = SimpleNamespace(max_execution_seconds=5.0)
+    repl.session_dir = tmp_path
+    repl.pending_cells = {
+        cell_id: PendingCell(cell=CodeCell(code=f"{cell_id} = 1", id=cell_id))
+        for cell_id in ("a", "b", "c")
+    }
+
+    repl._execute_cells(list(repl.pending_cells))
+
+    assert repl.kernel.executed == ["a = 1"]
+    assert repl.kernel.interrupts == 1
+    assert list(repl.pending_cells) == ["b", "c"]
+    assert ("append_event", ("system", {"action": "interrupt", "cell_id": "a"})) in repl.store.calls
+    assert not repl.codebook.calls
+
+
+def test_unknown_language_is_not_highlighted_as_python() -> None:
+    assert _lexer_for("python").name == "Python"
+    assert _lexer_for("no-such-language").name == "Text only"
+
+
+def test_empty_result_line_keeps_markup_like_cell_ids_literal() -> None:
+    repl = JT2Repl.__new__(JT2Repl)
+    repl.console = Console(file=io.StringIO(), width=80)
+
+    repl._render_execution_result("[/bad] [red]id", ExecutionResult())
+
+    assert repl.console.file.getvalue() == "[/bad] [red]id · (no output)\n"
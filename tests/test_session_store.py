@@ -16,3 +16,20 @@ def test_session_store_creates_directory(tmp_path: Path) -> None:
     assert len(events) == 1
 
     store.finish_session()
+
+
+def test_session_store_batches_events_until_flush(tmp_path: Path) -> None:
+    store = SessionStore(tmp_path / "runs", batch_size=3, flush_interval=60.0)
+    session_dir = store.start_session()
+    events_path = session_dir / "events.jsonl"
+
+    store.append_event("user", {"message": "one"})
+    store.append_event("user", {"message": "two"})
+    assert events_path.read_text(encoding="utf-8") == ""
+
+    store.append_event("user", {"message": "three"})
+    assert len(events_path.read_text(encoding="utf-8").splitlines()) == 3
+
+    store.append_event("user", {"message": "four"})
+    store.finish_session()
+    assert len(events_path.read_text(encoding="utf-8").splitlines()) == 4